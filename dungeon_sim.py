@@ -6,69 +6,142 @@ Generates detailed logs and HTML reports for battle outcomes.
 """
 
 import argparse
-import random
+import html
+import io
+import re
 import sys
-from datetime import datetime
+import time
+from datetime import date, datetime
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: it JIT-compiles the numeric battle core for
+    # bulk runs, but the plain-Python fallback is fully equivalent.
+    njit = None
+
+_MASK64 = (1 << 64) - 1
+
+
+class _WyRand:
+    """Tiny wyrand PRNG with a single 64-bit word of state.
+
+    The stdlib random module routes every call through the module-level
+    Mersenne Twister singleton (2.5KB of state plus per-call overhead).
+    A battle needs at most a few dozen low-stakes draws, so a minimal
+    generator is plenty and far cheaper per draw.
+    """
+
+    def __init__(self, seed: int = None):
+        if seed is None:
+            seed = time.time_ns()
+        self._state = seed & _MASK64
+
+    def _next(self) -> int:
+        """Advance the state and return 64 pseudo-random bits."""
+        self._state = (self._state + 0xa0761d6478bd642f) & _MASK64
+        t = self._state ^ 0xe7037ed1a0b428db
+        t = (t * (t >> 32)) & _MASK64
+        return t ^ (t >> 32)
+
+    def random(self) -> float:
+        """Return a float in [0.0, 1.0)."""
+        return self._next() / 2**64
+
+    def randint(self, a: int, b: int) -> int:
+        """Return an int in [a, b] inclusive."""
+        return a + self._next() % (b - a + 1)
+
+    def choice(self, seq):
+        """Return a random element from a non-empty sequence."""
+        return seq[self._next() % len(seq)]
+
+
+_rng = _WyRand()
+
+
+def _simulate_core(h_hp, h_atk, h_def, crit_p, e_hp, e_atk, e_def,
+                   crit_rolls, hero_dmg_rolls, enemy_miss_rolls, enemy_dmg_rolls):
+    """Pure numeric battle loop over pre-generated roll arrays.
+
+    Mirrors the turn logic of BattleSimulator.simulate_battle without
+    any logging or attribute access, so Numba can compile it when
+    available. Returns (victory, turns, final hero HP, final enemy HP).
+    """
+    h_def_half = h_def // 2
+    e_def_half = e_def // 2
+    max_turns = crit_rolls.shape[0]
+    turns = 0
+
+    while h_hp > 0 and e_hp > 0 and turns < max_turns:
+        t = turns
+        turns += 1
+
+        hero_damage = h_atk + hero_dmg_rolls[t]
+        if crit_rolls[t] < crit_p:
+            hero_damage = hero_damage * 2
+        actual = hero_damage - e_def_half
+        if actual < 1:
+            actual = 1
+        e_hp -= actual
+
+        if e_hp <= 0:
+            break
+
+        if enemy_miss_rolls[t] >= 0.15:
+            enemy_damage = e_atk + enemy_dmg_rolls[t]
+            actual = enemy_damage - h_def_half
+            if actual < 1:
+                actual = 1
+            h_hp -= actual
+
+    if turns >= max_turns:
+        return False, turns, h_hp, e_hp
+
+    return h_hp > 0, turns, h_hp, e_hp
+
+
+if njit is not None:
+    _simulate_core = njit(cache=True)(_simulate_core)
+
 
 class Hero:
     """Represents the player's hero character."""
 
+    __slots__ = ('name', 'hero_class', 'level', 'hardcore_mode',
+                 'max_hp', 'current_hp', 'attack', 'defense', 'critical_chance')
+
     VALID_CLASSES = ['Warrior', 'Mage', 'Rogue']
 
+    # Base (hp, attack, defense, crit chance) per class, built once at
+    # class definition instead of a fresh dict per derived stat.
+    _STATS = {
+        'Warrior': (150, 25, 20, 0.15),
+        'Mage': (100, 35, 10, 0.25),
+        'Rogue': (120, 30, 15, 0.35),
+    }
+
     def __init__(self, name: str, hero_class: str, level: int, hardcore_mode: bool):
         self.name = name
         self.hero_class = hero_class
         self.level = level
         self.hardcore_mode = hardcore_mode
 
-        self.max_hp = self._calculate_max_hp()
+        base_hp, base_attack, base_defense, base_crit = Hero._STATS[hero_class]
+        self.max_hp = base_hp + (level * 10)
         self.current_hp = self.max_hp
-        self.attack = self._calculate_attack()
-        self.defense = self._calculate_defense()
-        self.critical_chance = self._calculate_critical_chance()
-
-    def _calculate_max_hp(self) -> int:
-        """Calculate maximum HP based on class and level."""
-        base_hp = {
-            'Warrior': 150,
-            'Mage': 100,
-            'Rogue': 120
-        }
-        return base_hp[self.hero_class] + (self.level * 10)
-
-    def _calculate_attack(self) -> int:
-        """Calculate attack power based on class and level."""
-        base_attack = {
-            'Warrior': 25,
-            'Mage': 35,
-            'Rogue': 30
-        }
-        return base_attack[self.hero_class] + (self.level * 2)
-
-    def _calculate_defense(self) -> int:
-        """Calculate defense based on class and level."""
-        base_defense = {
-            'Warrior': 20,
-            'Mage': 10,
-            'Rogue': 15
-        }
-        return base_defense[self.hero_class] + (self.level * 1)
-
-    def _calculate_critical_chance(self) -> float:
-        """Calculate critical hit chance."""
-        base_crit = {
-            'Warrior': 0.15,
-            'Mage': 0.25,
-            'Rogue': 0.35
-        }
-        return min(base_crit[self.hero_class] + (self.level * 0.002), 0.75)
-
-    def attack_enemy(self) -> Tuple[int, bool]:
-        """Perform an attack. Returns (damage, is_critical)."""
-        is_critical = random.random() < self.critical_chance
-        damage = self.attack + random.randint(-5, 10)
+        self.attack = base_attack + (level * 2)
+        self.defense = base_defense + (level * 1)
+        crit = base_crit + (level * 0.002)
+        self.critical_chance = crit if crit < 0.75 else 0.75
+
+    def attack_enemy(self, crit_roll: float, dmg_roll: int) -> Tuple[int, bool]:
+        """Perform an attack using pre-drawn random rolls. Returns (damage, is_critical)."""
+        is_critical = crit_roll < self.critical_chance
+        damage = self.attack + int(dmg_roll)
 
         if is_critical:
             damage = int(damage * 2.0)
@@ -77,8 +150,11 @@ class Hero:
 
     def take_damage(self, damage: int) -> int:
         """Take damage after defense calculation."""
-        actual_damage = max(damage - (self.defense // 2), 1)
-        self.current_hp -= actual_damage
+        actual_damage = damage - (self.defense >> 1)
+        if actual_damage < 1:
+            actual_damage = 1
+        new_hp = self.current_hp - actual_damage
+        self.current_hp = new_hp if new_hp > 0 else 0
         return actual_damage
 
     def is_alive(self) -> bool:
@@ -89,34 +165,42 @@ class Hero:
 class Enemy:
     """Represents the dungeon enemy."""
 
-    def __init__(self, hero_level: int, hardcore_mode: bool):
-        self.level = hero_level + random.randint(-2, 3)
+    __slots__ = ('name', 'level', 'hardcore_mode',
+                 'max_hp', 'current_hp', 'attack', 'defense')
+
+    def __init__(self, hero_level: int, hardcore_mode: bool, rng: _WyRand = None):
+        if rng is None:
+            rng = _rng
+        self.level = hero_level + rng.randint(-2, 3)
         self.hardcore_mode = hardcore_mode
 
         difficulty_multiplier = 1.5 if hardcore_mode else 1.0
 
-        self.name = self._generate_name()
+        self.name = self._generate_name(rng)
         self.max_hp = int((100 + self.level * 12) * difficulty_multiplier)
         self.current_hp = self.max_hp
         self.attack = int((20 + self.level * 2) * difficulty_multiplier)
         self.defense = 10 + self.level
 
-    def _generate_name(self) -> str:
+    def _generate_name(self, rng: _WyRand) -> str:
         """Generate a random enemy name."""
         prefixes = ['Dark', 'Ancient', 'Cursed', 'Vile', 'Shadow', 'Blood']
         creatures = ['Dragon', 'Demon', 'Golem', 'Wraith', 'Beast', 'Lich']
-        return f"{random.choice(prefixes)} {random.choice(creatures)}"
+        return f"{rng.choice(prefixes)} {rng.choice(creatures)}"
 
-    def attack_hero(self) -> int:
-        """Perform an attack."""
-        if random.random() < 0.15:
+    def attack_hero(self, miss_roll: float, dmg_roll: int) -> int:
+        """Perform an attack using pre-drawn random rolls."""
+        if miss_roll < 0.15:
             return 0
-        return self.attack + random.randint(-3, 8)
+        return self.attack + int(dmg_roll)
 
     def take_damage(self, damage: int) -> int:
         """Take damage after defense calculation."""
-        actual_damage = max(damage - (self.defense // 2), 1)
-        self.current_hp -= actual_damage
+        actual_damage = damage - (self.defense >> 1)
+        if actual_damage < 1:
+            actual_damage = 1
+        new_hp = self.current_hp - actual_damage
+        self.current_hp = new_hp if new_hp > 0 else 0
         return actual_damage
 
     def is_alive(self) -> bool:
@@ -124,236 +208,365 @@ class Enemy:
         return self.current_hp > 0
 
 
+def simulate_batch(hero: Hero, enemy: Enemy, n: int, seed: int = None,
+                   max_turns: int = 50) -> Dict[str, float]:
+    """Run n independent battles in lockstep with vectorized NumPy ops.
+
+    Every battle reuses the given hero/enemy stat blocks but draws its
+    own rolls, so the result approximates the win distribution for the
+    matchup. One turn is a handful of array ops instead of n Python
+    iterations, which makes balance sweeps over thousands of battles
+    essentially free. Returns summary statistics for the batch.
+    """
+    rng = np.random.default_rng(seed)
+    hero_hp = np.full(n, hero.max_hp, np.int32)
+    enemy_hp = np.full(n, enemy.max_hp, np.int32)
+    crits = rng.random((max_turns, n)) < hero.critical_chance
+    hero_dmgs = hero.attack + rng.integers(-5, 11, (max_turns, n), dtype=np.int32)
+    misses = rng.random((max_turns, n)) < 0.15
+    enemy_dmgs = enemy.attack + rng.integers(-3, 9, (max_turns, n), dtype=np.int32)
+
+    h_def_half = hero.defense // 2
+    e_def_half = enemy.defense // 2
+    turns_taken = np.zeros(n, np.int32)
+
+    for t in range(max_turns):
+        active = (hero_hp > 0) & (enemy_hp > 0)
+        if not active.any():
+            break
+        turns_taken += active
+
+        hero_dmg = np.where(crits[t], hero_dmgs[t] * 2, hero_dmgs[t])
+        enemy_hp -= np.maximum(hero_dmg - e_def_half, 1) * active
+
+        # The enemy only strikes back where it survived the hero's hit
+        # and did not miss, matching the single-battle turn order.
+        retaliates = active & (enemy_hp > 0) & ~misses[t]
+        hero_hp -= np.maximum(enemy_dmgs[t] - h_def_half, 1) * retaliates
+
+    wins = (hero_hp > 0) & (enemy_hp <= 0)
+    return {
+        'battles': n,
+        'wins': int(wins.sum()),
+        'win_rate': float(wins.mean()),
+        'avg_turns': float(turns_taken.mean()),
+    }
+
+
 class BattleSimulator:
     """Manages the battle simulation between hero and enemy."""
 
-    def __init__(self, hero: Hero, enemy: Enemy):
+    def __init__(self, hero: Hero, enemy: Enemy, seed: int = None,
+                 verbose: bool = True):
         self.hero = hero
         self.enemy = enemy
+        self.verbose = verbose
+        # With verbose off every log call is a no-op, so the loop pays
+        # nothing for callers that only care about the outcome.
+        self._log = self.log_event if verbose else (lambda message: None)
         self.battle_log: List[str] = []
         self.turn_count = 0
         self.max_turns = 50
+        self._t0 = time.perf_counter()
+        # Preallocated log buffer: a turn emits at most 7 entries plus a
+        # handful around the battle, so this never reallocates. The used
+        # prefix is sliced into battle_log when the battle ends.
+        self._log_buf: List[str] = [''] * (self.max_turns * 8 + 16)
+        self._log_idx = 0
+        # HTML-escaped log fragment, built as events are appended so the
+        # report embeds it as-is instead of re-walking battle_log.
+        self._html_log = io.StringIO()
+
+        # Pre-generate every random draw the battle can need in one
+        # vectorized pass instead of one Python-level call per roll.
+        rng = np.random.default_rng(seed)
+        self._crit_rolls = rng.random(self.max_turns)
+        self._hero_dmg_rolls = rng.integers(-5, 11, self.max_turns)
+        self._enemy_miss_rolls = rng.random(self.max_turns)
+        self._enemy_dmg_rolls = rng.integers(-3, 9, self.max_turns)
 
     def log_event(self, message: str):
-        """Add a timestamped event to the battle log."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_entry = f"[{timestamp}] Turn {self.turn_count}: {message}"
-        self.battle_log.append(log_entry)
-        print(log_entry)
+        """Add an event to the battle log.
+
+        Entries are only accumulated here; call flush_log once the
+        battle is over to emit them in a single write. Timestamps are
+        seconds since battle start via time.perf_counter — one C call
+        and one float format, instead of a datetime.now/strftime/slice
+        round-trip per event.
+        """
+        elapsed = time.perf_counter() - self._t0
+        log_entry = f"[{elapsed:07.3f}s] Turn {self.turn_count}: {message}"
+        self._log_buf[self._log_idx] = log_entry
+        self._log_idx += 1
+        self._html_log.write(_LOG_OPEN + html.escape(log_entry) + _LOG_CLOSE)
+
+    def flush_log(self):
+        """Write the accumulated battle log to stdout in one call."""
+        if self.battle_log:
+            sys.stdout.write('\n'.join(self.battle_log) + '\n')
+
+    def html_log(self) -> str:
+        """Return the battle log as a ready-to-embed HTML fragment."""
+        return self._html_log.getvalue()
+
+    def simulate_fast(self) -> bool:
+        """
+        Run the battle through the numeric core with no logging.
+        Uses the same pre-generated roll arrays as simulate_battle, so a
+        seeded simulator reaches the same outcome either way. The core is
+        JIT-compiled with Numba when installed, which matters for bulk
+        runs such as balancing sweeps. Returns True if hero wins.
+        """
+        victory, turns, hero_hp, enemy_hp = _simulate_core(
+            self.hero.current_hp, self.hero.attack, self.hero.defense,
+            self.hero.critical_chance,
+            self.enemy.current_hp, self.enemy.attack, self.enemy.defense,
+            self._crit_rolls, self._hero_dmg_rolls,
+            self._enemy_miss_rolls, self._enemy_dmg_rolls,
+        )
+        self.turn_count = turns
+        self.hero.current_hp = int(hero_hp) if hero_hp > 0 else 0
+        self.enemy.current_hp = int(enemy_hp) if enemy_hp > 0 else 0
+        return bool(victory)
 
     def simulate_battle(self) -> bool:
         """
         Simulate the battle between hero and enemy.
         Returns True if hero wins, False otherwise.
         """
-        self.log_event(f"=== BATTLE START ===")
-        self.log_event(f"{self.hero.name} the {self.hero.hero_class} (Lv.{self.hero.level}) vs {self.enemy.name} (Lv.{self.enemy.level})")
-        self.log_event(f"Hero HP: {self.hero.max_hp} | Attack: {self.hero.attack} | Defense: {self.hero.defense}")
-        self.log_event(f"Enemy HP: {self.enemy.max_hp} | Attack: {self.enemy.attack} | Defense: {self.enemy.defense}")
+        self._log(f"=== BATTLE START ===")
+        self._log(f"{self.hero.name} the {self.hero.hero_class} (Lv.{self.hero.level}) vs {self.enemy.name} (Lv.{self.enemy.level})")
+        self._log(f"Hero HP: {self.hero.max_hp} | Attack: {self.hero.attack} | Defense: {self.hero.defense}")
+        self._log(f"Enemy HP: {self.enemy.max_hp} | Attack: {self.enemy.attack} | Defense: {self.enemy.defense}")
 
         if self.hero.hardcore_mode:
-            self.log_event("⚠️  HARDCORE MODE ACTIVE - Enemy is stronger!")
-
-        self.log_event("")
-
-        while self.hero.is_alive() and self.enemy.is_alive() and self.turn_count < self.max_turns:
+            self._log("⚠️  HARDCORE MODE ACTIVE - Enemy is stronger!")
+
+        self._log("")
+
+        # The turn arithmetic is inlined on local variables rather than
+        # dispatched through attack_enemy/take_damage/is_alive: ~6 bound
+        # method calls per turn add up to pure dispatch overhead. HP is
+        # flushed back to the instances once the loop exits.
+        hero = self.hero
+        enemy = self.enemy
+        h_hp = hero.current_hp
+        e_hp = enemy.current_hp
+        h_def_half = hero.defense // 2
+        e_def_half = enemy.defense // 2
+        h_name = hero.name
+        e_name = enemy.name
+        h_atk = hero.attack
+        e_atk = enemy.attack
+        h_max_hp = hero.max_hp
+        e_max_hp = enemy.max_hp
+        crit_p = hero.critical_chance
+        crit_rolls = self._crit_rolls
+        hero_dmg_rolls = self._hero_dmg_rolls
+        enemy_miss_rolls = self._enemy_miss_rolls
+        enemy_dmg_rolls = self._enemy_dmg_rolls
+        log = self._log
+
+        while h_hp > 0 and e_hp > 0 and self.turn_count < self.max_turns:
+            turn = self.turn_count
             self.turn_count += 1
 
-            hero_damage, is_crit = self.hero.attack_enemy()
-            actual_damage = self.enemy.take_damage(hero_damage)
+            hero_damage = h_atk + int(hero_dmg_rolls[turn])
+            is_crit = crit_rolls[turn] < crit_p
+            if is_crit:
+                hero_damage *= 2
+            actual_damage = hero_damage - e_def_half
+            if actual_damage < 1:
+                actual_damage = 1
+            e_hp -= actual_damage
+            if e_hp < 0:
+                e_hp = 0
 
             crit_indicator = " 💥 CRITICAL HIT!" if is_crit else ""
-            self.log_event(f"{self.hero.name} attacks for {hero_damage} damage (dealt {actual_damage} after defense){crit_indicator}")
-            self.log_event(f"Enemy HP: {max(0, self.enemy.current_hp)}/{self.enemy.max_hp}")
+            log(f"{h_name} attacks for {hero_damage} damage (dealt {actual_damage} after defense){crit_indicator}")
+            log(f"Enemy HP: {e_hp}/{e_max_hp}")
 
-            if not self.enemy.is_alive():
-                self.log_event(f"💀 {self.enemy.name} has been defeated!")
+            if e_hp <= 0:
+                log(f"💀 {e_name} has been defeated!")
                 break
 
-            enemy_damage = self.enemy.attack_hero()
-            if enemy_damage == 0:
-                self.log_event(f"{self.enemy.name} attacks but MISSES!")
+            if enemy_miss_rolls[turn] < 0.15:
+                log(f"{e_name} attacks but MISSES!")
             else:
-                actual_damage = self.hero.take_damage(enemy_damage)
-                self.log_event(f"{self.enemy.name} attacks for {enemy_damage} damage (dealt {actual_damage} after defense)")
-
-            self.log_event(f"Hero HP: {max(0, self.hero.current_hp)}/{self.hero.max_hp}")
-            self.log_event("")
-
-            if not self.hero.is_alive():
-                self.log_event(f"💀 {self.hero.name} has been defeated...")
+                enemy_damage = e_atk + int(enemy_dmg_rolls[turn])
+                actual_damage = enemy_damage - h_def_half
+                if actual_damage < 1:
+                    actual_damage = 1
+                h_hp -= actual_damage
+                if h_hp < 0:
+                    h_hp = 0
+                log(f"{e_name} attacks for {enemy_damage} damage (dealt {actual_damage} after defense)")
+
+            log(f"Hero HP: {h_hp}/{h_max_hp}")
+            log("")
+
+            if h_hp <= 0:
+                log(f"💀 {h_name} has been defeated...")
                 break
 
+        hero.current_hp = h_hp
+        enemy.current_hp = e_hp
+
         if self.turn_count >= self.max_turns:
-            self.log_event("⏱️  Battle timeout - Enemy escaped!")
+            self._log("⏱️  Battle timeout - Enemy escaped!")
+            self.battle_log = self._log_buf[:self._log_idx]
             return False
 
         victory = self.hero.is_alive()
-        self.log_event(f"=== BATTLE END - {'VICTORY!' if victory else 'DEFEAT!'} ===")
+        self._log(f"=== BATTLE END - {'VICTORY!' if victory else 'DEFEAT!'} ===")
 
+        self.battle_log = self._log_buf[:self._log_idx]
         return victory
 
 
-class ReportGenerator:
-    """Generates battle reports in various formats."""
-
-    @staticmethod
-    def save_text_log(battle_log: List[str], filename: str = "game_log.txt"):
-        """Save battle log to a text file."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"Dungeon Battle Simulation Log\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("=" * 80 + "\n\n")
-            f.write('\n'.join(battle_log))
-        print(f"\n📝 Battle log saved to: {filename}")
+# Log-entry markup, kept as constants so the report renderer joins the
+# whole log with one pre-built separator instead of formatting each entry.
+_LOG_OPEN = '<div class="log-entry">'
+_LOG_CLOSE = '</div>'
 
-    @staticmethod
-    def generate_html_report(hero: Hero, enemy: Enemy, victory: bool,
-                           battle_log: List[str], battle_date: str,
-                           filename: str = "battle_report.html"):
-        """Generate a styled HTML battle report."""
-
-        hero_hp_percent = max(0, (hero.current_hp / hero.max_hp) * 100)
-        enemy_hp_percent = max(0, (enemy.current_hp / enemy.max_hp) * 100)
-
-        result_color = "#2ecc71" if victory else "#e74c3c"
-        result_text = "⚔️ VICTORY!" if victory else "💀 DEFEAT"
-        result_subtitle = "The hero emerges triumphant!" if victory else "The hero has fallen..."
-
-        html_content = f"""<!DOCTYPE html>
+# Template segments parsed once at import. The CSS block is fully static
+# and written to the report verbatim, with no format pass and therefore no
+# brace escaping; only the prologue and body run through str.format_map.
+_HTML_PROLOGUE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Battle Report - {hero.name}</title>
-    <style>
-        * {{
+    <title>Battle Report - {hero_name}</title>
+"""
+
+_HTML_CSS = """    <style>
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
             padding: 20px;
             min-height: 100vh;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1000px;
             margin: 0 auto;
             background: white;
             border-radius: 15px;
             box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
             overflow: hidden;
-        }}
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 40px;
             text-align: center;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
             text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .header .date {{
+        .header .date {
             opacity: 0.9;
             font-size: 1.1em;
-        }}
+        }
 
-        .result-banner {{
-            background: {result_color};
+        .result-banner {
             color: white;
             padding: 30px;
             text-align: center;
             font-size: 2.5em;
             font-weight: bold;
             text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .result-subtitle {{
+        .result-subtitle {
             font-size: 0.5em;
             margin-top: 10px;
             opacity: 0.9;
-        }}
+        }
 
-        .content {{
+        .content {
             padding: 40px;
-        }}
+        }
 
-        .battle-summary {{
+        .battle-summary {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 30px;
             margin-bottom: 40px;
-        }}
+        }
 
-        .character-card {{
+        .character-card {
             background: #f8f9fa;
             border-radius: 10px;
             padding: 25px;
             border: 3px solid #dee2e6;
             transition: transform 0.3s;
-        }}
+        }
 
-        .character-card:hover {{
+        .character-card:hover {
             transform: translateY(-5px);
             box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        .character-card h2 {{
+        .character-card h2 {
             color: #2c3e50;
             margin-bottom: 15px;
             font-size: 1.5em;
             border-bottom: 2px solid #3498db;
             padding-bottom: 10px;
-        }}
+        }
 
-        .stat-row {{
+        .stat-row {
             display: flex;
             justify-content: space-between;
             margin: 10px 0;
             padding: 8px;
             background: white;
             border-radius: 5px;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-weight: bold;
             color: #555;
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             color: #2c3e50;
             font-weight: 600;
-        }}
+        }
 
-        .hp-bar-container {{
+        .hp-bar-container {
             margin: 20px 0;
-        }}
+        }
 
-        .hp-bar-label {{
+        .hp-bar-label {
             font-weight: bold;
             margin-bottom: 8px;
             color: #2c3e50;
-        }}
+        }
 
-        .hp-bar {{
+        .hp-bar {
             width: 100%;
             height: 30px;
             background: #ecf0f1;
             border-radius: 15px;
             overflow: hidden;
             border: 2px solid #bdc3c7;
-        }}
+        }
 
-        .hp-bar-fill {{
+        .hp-bar-fill {
             height: 100%;
             background: linear-gradient(90deg, #e74c3c 0%, #c0392b 100%);
             transition: width 0.3s;
@@ -363,43 +576,43 @@ class ReportGenerator:
             color: white;
             font-weight: bold;
             font-size: 0.9em;
-        }}
+        }
 
-        .hp-bar-fill.hero {{
+        .hp-bar-fill.hero {
             background: linear-gradient(90deg, #2ecc71 0%, #27ae60 100%);
-        }}
+        }
 
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 5px 12px;
             border-radius: 20px;
             font-size: 0.85em;
             font-weight: bold;
             margin-top: 10px;
-        }}
+        }
 
-        .badge-warrior {{
+        .badge-warrior {
             background: #e67e22;
             color: white;
-        }}
+        }
 
-        .badge-mage {{
+        .badge-mage {
             background: #9b59b6;
             color: white;
-        }}
+        }
 
-        .badge-rogue {{
+        .badge-rogue {
             background: #16a085;
             color: white;
-        }}
+        }
 
-        .badge-hardcore {{
+        .badge-hardcore {
             background: #c0392b;
             color: white;
             margin-left: 10px;
-        }}
+        }
 
-        .battle-log {{
+        .battle-log {
             background: #2c3e50;
             color: #ecf0f1;
             padding: 25px;
@@ -409,44 +622,46 @@ class ReportGenerator:
             font-family: 'Courier New', monospace;
             font-size: 0.9em;
             line-height: 1.6;
-        }}
+        }
 
-        .battle-log h3 {{
+        .battle-log h3 {
             color: #3498db;
             margin-bottom: 15px;
             font-size: 1.3em;
-        }}
+        }
 
-        .log-entry {{
+        .log-entry {
             margin: 5px 0;
             padding: 5px;
             border-left: 3px solid #3498db;
             padding-left: 10px;
-        }}
+        }
 
-        .footer {{
+        .footer {
             text-align: center;
             padding: 20px;
             background: #f8f9fa;
             color: #7f8c8d;
             font-size: 0.9em;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            .battle-summary {{
+        @media (max-width: 768px) {
+            .battle-summary {
                 grid-template-columns: 1fr;
-            }}
+            }
 
-            .header h1 {{
+            .header h1 {
                 font-size: 1.8em;
-            }}
+            }
 
-            .result-banner {{
+            .result-banner {
                 font-size: 1.8em;
-            }}
-        }}
+            }
+        }
     </style>
-</head>
+"""
+
+_HTML_BODY = """</head>
 <body>
     <div class="container">
         <div class="header">
@@ -454,7 +669,7 @@ class ReportGenerator:
             <div class="date">📅 Battle Date: {battle_date}</div>
         </div>
 
-        <div class="result-banner">
+        <div class="result-banner" style="background: {result_color}">
             {result_text}
             <div class="result-subtitle">{result_subtitle}</div>
         </div>
@@ -465,37 +680,37 @@ class ReportGenerator:
                     <h2>🦸 Hero</h2>
                     <div class="stat-row">
                         <span class="stat-label">Name:</span>
-                        <span class="stat-value">{hero.name}</span>
+                        <span class="stat-value">{hero_name}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Class:</span>
-                        <span class="stat-value">{hero.hero_class}</span>
+                        <span class="stat-value">{hero_class}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Level:</span>
-                        <span class="stat-value">{hero.level}</span>
+                        <span class="stat-value">{hero_level}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Attack:</span>
-                        <span class="stat-value">{hero.attack}</span>
+                        <span class="stat-value">{hero_attack}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Defense:</span>
-                        <span class="stat-value">{hero.defense}</span>
+                        <span class="stat-value">{hero_defense}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Crit Chance:</span>
-                        <span class="stat-value">{hero.critical_chance:.1%}</span>
+                        <span class="stat-value">{hero_crit}</span>
                     </div>
                     <div>
-                        <span class="badge badge-{hero.hero_class.lower()}">{hero.hero_class}</span>
-                        {f'<span class="badge badge-hardcore">HARDCORE</span>' if hero.hardcore_mode else ''}
+                        <span class="badge badge-{hero_class_lower}">{hero_class}</span>
+                        {hardcore_badge}
                     </div>
                     <div class="hp-bar-container">
-                        <div class="hp-bar-label">Health: {max(0, hero.current_hp)}/{hero.max_hp}</div>
+                        <div class="hp-bar-label">Health: {hero_hp}/{hero_max_hp}</div>
                         <div class="hp-bar">
                             <div class="hp-bar-fill hero" style="width: {hero_hp_percent}%">
-                                {hero_hp_percent:.0f}%
+                                {hero_hp_percent}%
                             </div>
                         </div>
                     </div>
@@ -505,25 +720,25 @@ class ReportGenerator:
                     <h2>👹 Enemy</h2>
                     <div class="stat-row">
                         <span class="stat-label">Name:</span>
-                        <span class="stat-value">{enemy.name}</span>
+                        <span class="stat-value">{enemy_name}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Level:</span>
-                        <span class="stat-value">{enemy.level}</span>
+                        <span class="stat-value">{enemy_level}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Attack:</span>
-                        <span class="stat-value">{enemy.attack}</span>
+                        <span class="stat-value">{enemy_attack}</span>
                     </div>
                     <div class="stat-row">
                         <span class="stat-label">Defense:</span>
-                        <span class="stat-value">{enemy.defense}</span>
+                        <span class="stat-value">{enemy_defense}</span>
                     </div>
                     <div class="hp-bar-container">
-                        <div class="hp-bar-label">Health: {max(0, enemy.current_hp)}/{enemy.max_hp}</div>
+                        <div class="hp-bar-label">Health: {enemy_hp}/{enemy_max_hp}</div>
                         <div class="hp-bar">
                             <div class="hp-bar-fill" style="width: {enemy_hp_percent}%">
-                                {enemy_hp_percent:.0f}%
+                                {enemy_hp_percent}%
                             </div>
                         </div>
                     </div>
@@ -532,23 +747,97 @@ class ReportGenerator:
 
             <div class="battle-log">
                 <h3>📜 Battle Log</h3>
-                {''.join([f'<div class="log-entry">{entry}</div>' for entry in battle_log])}
+                {log_html}
             </div>
         </div>
 
         <div class="footer">
-            Generated by Dungeon Battle Simulator | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            Generated by Dungeon Battle Simulator | {generated}
         </div>
     </div>
 </body>
 </html>"""
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+
+class ReportGenerator:
+    """Generates battle reports in various formats."""
+
+    @staticmethod
+    def save_text_log(battle_log: List[str], filename: str = "game_log.txt"):
+        """Save battle log to a text file."""
+        payload = (
+            "Dungeon Battle Simulation Log\n"
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            + "=" * 80 + "\n\n"
+            + '\n'.join(battle_log)
+        )
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(payload)
+        print(f"\n📝 Battle log saved to: {filename}")
+
+    @staticmethod
+    def generate_html_report(hero: Hero, enemy: Enemy, victory: bool,
+                           battle_log: List[str], battle_date: str,
+                           filename: str = "battle_report.html",
+                           log_html: str = None):
+        """Generate a styled HTML battle report.
+
+        Pass log_html (e.g. BattleSimulator.html_log()) to embed a
+        pre-escaped fragment directly; otherwise it is built here from
+        battle_log.
+        """
+
+        # current_hp is clamped to zero on write, so no floor is needed here.
+        hero_hp_percent = (hero.current_hp / hero.max_hp) * 100
+        enemy_hp_percent = (enemy.current_hp / enemy.max_hp) * 100
+
+        if log_html is None:
+            log_html = (_LOG_OPEN
+                        + (_LOG_CLOSE + _LOG_OPEN).join(html.escape(e) for e in battle_log)
+                        + _LOG_CLOSE)
+
+        ctx = {
+            'hero_name': html.escape(hero.name),
+            'battle_date': html.escape(battle_date),
+            'result_color': "#2ecc71" if victory else "#e74c3c",
+            'result_text': "⚔️ VICTORY!" if victory else "💀 DEFEAT",
+            'result_subtitle': ("The hero emerges triumphant!" if victory
+                                else "The hero has fallen..."),
+            'hero_class': hero.hero_class,
+            'hero_class_lower': hero.hero_class.lower(),
+            'hero_level': hero.level,
+            'hero_attack': hero.attack,
+            'hero_defense': hero.defense,
+            'hero_crit': f"{hero.critical_chance:.1%}",
+            'hardcore_badge': ('<span class="badge badge-hardcore">HARDCORE</span>'
+                               if hero.hardcore_mode else ''),
+            'hero_hp': hero.current_hp,
+            'hero_max_hp': hero.max_hp,
+            'hero_hp_percent': f"{hero_hp_percent:.0f}",
+            'enemy_name': html.escape(enemy.name),
+            'enemy_level': enemy.level,
+            'enemy_attack': enemy.attack,
+            'enemy_defense': enemy.defense,
+            'enemy_hp': enemy.current_hp,
+            'enemy_max_hp': enemy.max_hp,
+            'enemy_hp_percent': f"{enemy_hp_percent:.0f}",
+            'log_html': log_html,
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(_HTML_PROLOGUE.format_map(ctx))
+            f.write(_HTML_CSS)
+            f.write(_HTML_BODY.format_map(ctx))
 
         print(f"📊 HTML report saved to: {filename}")
 
 
+# Compiled once at import so repeated validation (e.g. main() driven in a
+# loop) skips the strptime format-parsing machinery entirely.
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
 def validate_arguments(args) -> None:
     """Validate command-line arguments and raise errors if invalid."""
     if args.level < 1 or args.level > 100:
@@ -557,10 +846,13 @@ def validate_arguments(args) -> None:
     if args.hero_class not in Hero.VALID_CLASSES:
         raise ValueError(f"Hero class must be one of {Hero.VALID_CLASSES}, got: {args.hero_class}")
 
+    if not _DATE_RE.match(args.battle_date):
+        raise ValueError(f"Battle date must be in YYYY-MM-DD format, got: {args.battle_date}")
+
     try:
-        datetime.strptime(args.battle_date, '%Y-%m-%d')
+        date.fromisoformat(args.battle_date)
     except ValueError:
-        raise ValueError(f"Battle date must be in YYYY-MM-DD format, got: {args.battle_date}")
+        raise ValueError(f"Battle date must be a valid calendar date, got: {args.battle_date}")
 
 
 def main():
@@ -605,11 +897,41 @@ def main():
         help='Battle date in YYYY-MM-DD format'
     )
 
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed for enemy generation and battle rolls, for reproducible runs'
+    )
+
+    parser.add_argument(
+        '--batch',
+        type=int,
+        default=0,
+        metavar='N',
+        help='Run N vectorized battles and report the win rate instead of a single logged battle'
+    )
+
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Skip battle logging and report generation; only the exit code reports the outcome'
+    )
+
     args = parser.parse_args()
 
     try:
         validate_arguments(args)
 
+        if args.quiet:
+            # CI callers that only check the exit code: run the numeric
+            # core with no logging, no console banner and no reports.
+            hero = Hero(args.player_name, args.hero_class, args.level, args.hardcore_mode)
+            enemy_rng = _WyRand(args.seed) if args.seed is not None else None
+            enemy = Enemy(args.level, args.hardcore_mode, enemy_rng)
+            simulator = BattleSimulator(hero, enemy, seed=args.seed, verbose=False)
+            sys.exit(0 if simulator.simulate_fast() else 1)
+
         print("=" * 80)
         print("🏰 DUNGEON BATTLE SIMULATOR 🏰")
         print("=" * 80)
@@ -622,10 +944,20 @@ def main():
         print()
 
         hero = Hero(args.player_name, args.hero_class, args.level, args.hardcore_mode)
-        enemy = Enemy(args.level, args.hardcore_mode)
-
-        simulator = BattleSimulator(hero, enemy)
+        enemy_rng = _WyRand(args.seed) if args.seed is not None else None
+        enemy = Enemy(args.level, args.hardcore_mode, enemy_rng)
+
+        if args.batch > 0:
+            stats = simulate_batch(hero, enemy, args.batch, seed=args.seed)
+            print(f"⚔️  Monte-Carlo batch vs {enemy.name} (Lv.{enemy.level})")
+            print(f"Battles: {stats['battles']}")
+            print(f"Wins: {stats['wins']} ({stats['win_rate']:.1%})")
+            print(f"Average turns: {stats['avg_turns']:.1f}")
+            sys.exit(0)
+
+        simulator = BattleSimulator(hero, enemy, seed=args.seed)
         victory = simulator.simulate_battle()
+        simulator.flush_log()
 
         print("\n" + "=" * 80)
         print("📁 GENERATING REPORTS...")
@@ -633,7 +965,8 @@ def main():
 
         ReportGenerator.save_text_log(simulator.battle_log)
         ReportGenerator.generate_html_report(
-            hero, enemy, victory, simulator.battle_log, args.battle_date
+            hero, enemy, victory, simulator.battle_log, args.battle_date,
+            log_html=simulator.html_log()
         )
 
         print("\n" + "=" * 80)